@@ -6,21 +6,45 @@ Run: python spinner.py
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import ctypes
 from ctypes import wintypes
+import functools
 import itertools
 import os
 import sys
-import textwrap
 import time
-from typing import Callable, Iterable, List, Sequence
+from typing import Callable, Iterable, Iterator, List, Sequence, Tuple
 
 
 ESC = "\033"
 MOVE_HOME = f"{ESC}[H"
 CLEAR_SCREEN = f"{ESC}[2J"
 CLEAR_AND_HOME = f"{CLEAR_SCREEN}{MOVE_HOME}"
+ERASE_STRATEGIES = ("diff", "home", "clear")
 ENABLE_VT_FLAG = 0x0004  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+STD_OUTPUT_HANDLE = -11
+STOP_HINT = "Press Ctrl+C to stop.\n"
+STOPPED_MESSAGE = f"{CLEAR_AND_HOME}Stopped. Thanks for spinning!\n"
+SPIN_THRESHOLD = 2e-3  # Below this, Windows sleeps overshoot; spin instead.
+SLEEP_SLACK = 1e-3  # Portion of the wait left for the spin on Windows.
+
+_ON_WINDOWS = os.name == "nt"
+_VT_ENABLED: bool | None = None  # None until the first attempt; failures are cached too.
+
+if _ON_WINDOWS:
+    # Resolve and prototype the console calls once instead of on every animate().
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=False)
+    _GetStdHandle = _kernel32.GetStdHandle
+    _GetStdHandle.argtypes = [wintypes.DWORD]
+    _GetStdHandle.restype = wintypes.HANDLE
+    _GetConsoleMode = _kernel32.GetConsoleMode
+    _GetConsoleMode.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+    _GetConsoleMode.restype = wintypes.BOOL
+    _SetConsoleMode = _kernel32.SetConsoleMode
+    _SetConsoleMode.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _SetConsoleMode.restype = wintypes.BOOL
 
 
 class Spinner:
@@ -29,149 +53,210 @@ class Spinner:
             raise ValueError("Spinner requires at least one frame.")
         self.frames = frames
         self.delay = delay
+        # Full per-frame output (clear, frame, hint) so each tick is one write.
+        self._rendered = [f"{CLEAR_AND_HOME}{frame}\n{STOP_HINT}" for frame in frames]
+        grids = _pad_lines([frame.split("\n") for frame in frames])
+        homed = [MOVE_HOME + "\n".join(grid) + "\n" + STOP_HINT for grid in grids]
+        # Later ticks assume the padded rectangle is on screen, hint included.
+        first = CLEAR_AND_HOME + "\n".join(grids[0]) + "\n" + STOP_HINT
+        # Per erase strategy: tick 0 draws a full frame, later ticks walk the rest,
+        # wrapping back to index 1.
+        self._updates = {
+            "diff": [first] + _frame_deltas(grids),
+            "home": [first] + homed[1:] + homed[:1],
+            "clear": self._rendered + self._rendered[:1],
+        }
+        # Pre-encoded copies for writing straight to a binary stream; None if not ASCII.
+        self._update_bytes = {name: _encode_ascii(updates) for name, updates in self._updates.items()}
 
     def cycle(self) -> Iterable[str]:
         return itertools.cycle(self.frames)
 
+    def cycle_rendered(self) -> Iterable[str]:
+        return itertools.cycle(self._rendered)
 
-def _dedent_lines(block: str) -> List[str]:
-    lines = textwrap.dedent(block).strip("\n").splitlines()
-    return lines
+
+def _encode_ascii(payloads: Sequence[str]) -> List[bytes] | None:
+    try:
+        return [payload.encode("ascii") for payload in payloads]
+    except UnicodeEncodeError:
+        return None
 
 
-def _normalize_frames(raw_frames: Sequence[str]) -> List[str]:
-    split_frames = [_dedent_lines(frame) for frame in raw_frames]
+def _pad_lines(split_frames: Sequence[List[str]]) -> List[List[str]]:
     width = max(len(line) for frame in split_frames for line in frame)
     height = max(len(frame) for frame in split_frames)
-
-    normalized = []
-    for frame in split_frames:
-        padded_lines = [line.ljust(width) for line in frame]
-        if len(padded_lines) < height:
-            padded_lines.extend([" " * width] * (height - len(padded_lines)))
-        normalized.append("\n".join(padded_lines))
-    return normalized
+    blank = " " * width
+    return [[line + blank[len(line):] for line in frame] + [blank] * (height - len(frame)) for frame in split_frames]
+
+
+def _frame_deltas(grids: Sequence[List[str]]) -> List[str]:
+    width = len(grids[0][0])
+    height = len(grids[0])
+    # Leave the cursor below the stop hint, where a full frame would have left it.
+    park = f"{ESC}[{height + 2};1H"
+
+    deltas = []
+    for index, before in enumerate(grids):
+        after = grids[(index + 1) % len(grids)]
+        parts = []
+        for row, (old_line, new_line) in enumerate(zip(before, after)):
+            changed = [col for col in range(width) if old_line[col] != new_line[col]]
+            if not changed:
+                continue
+            start = end = changed[0]
+            for col in changed[1:]:
+                # Re-sending a short unchanged gap is cheaper than a new cursor move.
+                if col - end - 1 < len(f"{ESC}[{row + 1};{col + 1}H"):
+                    end = col
+                    continue
+                parts.append(f"{ESC}[{row + 1};{start + 1}H{new_line[start:end + 1]}")
+                start = end = col
+            parts.append(f"{ESC}[{row + 1};{start + 1}H{new_line[start:end + 1]}")
+        if not parts:
+            deltas.append("")
+            continue
+        patch = "".join(parts) + park
+        redraw = MOVE_HOME + "\n".join(after) + park
+        deltas.append(min(patch, redraw, key=len))
+    return deltas
+
+
+# Frames are stored dedented and padded to a common rectangle so nothing has to
+# be normalized at import time.
+_CHIP_FRAMES: tuple[str, ...] = (
+    (
+        "       ____________       \n"
+        "    .-'            '-.    \n"
+        "  .'    _  LAYS _     '.  \n"
+        " /    .' `'----'`.      \\ \n"
+        "|    /  o      o  \\      |\n"
+        "|    |            |      |\n"
+        " \\    \\   .--.   /      / \n"
+        "  '.   '._\\__/_.''    .'  \n"
+        "    '-.          .-'      \n"
+        "       '--------'         "
+    ),
+    (
+        "         _______          \n"
+        "    .-''        ''-.      \n"
+        "  .'    LAYS        '.    \n"
+        " /    .-\"\"\"\"-.        \\   \n"
+        "|   /  o  o  \\         |  \n"
+        "|   \\   __   /         |  \n"
+        " \\    '-.__.-'        /   \n"
+        "  '.                .'    \n"
+        "     '-.        .-'       \n"
+        "        '------'          "
+    ),
+    (
+        "   __________             \n"
+        " /          /             \n"
+        "/  LAYS    /              \n"
+        "\\         /               \n"
+        " \\_______/                \n"
+        " /       \\                \n"
+        "/_________\\               \n"
+        "                          \n"
+        "                          \n"
+        "                          "
+    ),
+    (
+        "         _______          \n"
+        "    .-''        ''-.      \n"
+        "  .'        LAYS    '.    \n"
+        " /        .-\"\"\"\"-.    \\   \n"
+        "|         \\ o  o /     |  \n"
+        "|         /  __  \\     |  \n"
+        " \\        '-.__.-'    /   \n"
+        "  '.                .'    \n"
+        "     '-.        .-'       \n"
+        "        '------'          "
+    ),
+)
+
+_COCKROACH_FRAMES: tuple[str, ...] = (
+    (
+        "           /\\        /\\           \n"
+        "     ___.-'( )------( )'-.___     \n"
+        "   .'      /  \\    /  \\      '.   \n"
+        "  /      _/____\\__/____\\_      \\  \n"
+        " /      /  /  /    \\  \\  \\      \\ \n"
+        "|      |  /__/      \\__\\  |      |\n"
+        " \\      \\              /      /   \n"
+        "  '.      '._      _.'      .'    \n"
+        "     '-._____\\____/_____.-'       \n"
+        "        /    /    \\    \\          \n"
+        "       (    (      )    )         \n"
+        "                                  "
+    ),
+    (
+        "           /\\  /\\                 \n"
+        "          (  \\/  )                \n"
+        "     ___.- \\    / -.___           \n"
+        "   .'      \\__/      '.           \n"
+        "  /      __/  \\__      \\          \n"
+        " /     _/  /\\  \\_ \\     \\         \n"
+        "|     |__ /  \\ __| |     |        \n"
+        " \\      /      \\      /           \n"
+        "  '.    '._  _.'    .'            \n"
+        "     '-.____\\/____.-'             \n"
+        "        /    /\\    \\              \n"
+        "       (    (  )    )             "
+    ),
+    (
+        "           /\\        /\\           \n"
+        "          //\\\\      //\\\\          \n"
+        "     ____//  \\\\____//  \\\\____     \n"
+        "   .'      /\\  /\\  /\\      '.     \n"
+        "  /      _/  \\/  \\/  \\_      \\    \n"
+        " /     _/   (      )   \\_     \\   \n"
+        "|     |__   \\_/\\__/   __|     |   \n"
+        " \\      /            \\      /     \n"
+        "  '.    '._        _.'    .'      \n"
+        "     '-.____\\____/____.-'         \n"
+        "        /    /    \\    \\          \n"
+        "       (    (      )    )         "
+    ),
+    (
+        "          /\\  /\\                  \n"
+        "         (  \\/  )                 \n"
+        "     ____/      \\____             \n"
+        "   .'     /\\  /\\     '.           \n"
+        "  /     _/  \\/  \\_     \\          \n"
+        " /    _/   /\\   \\_ \\    \\         \n"
+        "|    |__  /  \\  __| |    |        \n"
+        " \\     /        \\     /           \n"
+        "  '.   '._    _.'   .'            \n"
+        "     '-.___\\__/__.-'              \n"
+        "        /   /\\   \\                \n"
+        "       (   (  )   )               "
+    ),
+)
 
 
 def chip_spinner() -> Spinner:
-    raw_frames = [
-        r'''
-                   ____________
-                .-'            '-.
-              .'    _  LAYS _     '.
-             /    .' `'----'`.      \
-            |    /  o      o  \      |
-            |    |            |      |
-             \    \   .--.   /      /
-              '.   '._\__/_.''    .'
-                '-.          .-'
-                   '--------'
-        ''',
-        r'''
-                     _______
-                .-''        ''-.
-              .'    LAYS        '.
-             /    .-""""-.        \
-            |   /  o  o  \         |
-            |   \   __   /         |
-             \    '-.__.-'        /
-              '.                .'
-                 '-.        .-'
-                    '------'
-        ''',
-        r'''
-                     __________
-                   /          /
-                  /  LAYS    /
-                  \         /
-                   \_______/
-                   /       \
-                  /_________\
-        ''',
-        r'''
-                    _______
-               .-''        ''-.
-             .'        LAYS    '.
-            /        .-""""-.    \
-           |         \ o  o /     |
-           |         /  __  \     |
-            \        '-.__.-'    /
-             '.                .'
-                '-.        .-'
-                   '------'
-        ''',
-    ]
-    return Spinner(_normalize_frames(raw_frames), delay=0.12)
+    return Spinner(_CHIP_FRAMES, delay=0.12)
 
 
 def cockroach_spinner() -> Spinner:
-    raw_frames = [
-        r"""
-                       /\        /\
-                 ___.-'( )------( )'-.___
-               .'      /  \    /  \      '.
-              /      _/____\__/____\_      \
-             /      /  /  /    \  \  \      \
-            |      |  /__/      \__\  |      |
-             \      \              /      /
-              '.      '._      _.'      .'
-                 '-._____\____/_____.-'
-                    /    /    \    \
-                   (    (      )    )
-        """,
-        r"""
-                       /\  /\ 
-                      (  \/  )
-                 ___.- \    / -.___
-               .'      \__/      '.
-              /      __/  \__      \
-             /     _/  /\  \_ \     \
-            |     |__ /  \ __| |     |
-             \      /      \      /
-              '.    '._  _.'    .'
-                 '-.____\/____.-'
-                    /    /\    \
-                   (    (  )    )
-        """,
-        r"""
-                       /\        /\
-                      //\\      //\\
-                 ____//  \\____//  \\____
-               .'      /\  /\  /\      '.
-              /      _/  \/  \/  \_      \
-             /     _/   (      )   \_     \
-            |     |__   \_/\__/   __|     |
-             \      /            \      /
-              '.    '._        _.'    .'
-                 '-.____\____/____.-'
-                    /    /    \    \
-                   (    (      )    )
-        """,
-        r"""
-                      /\  /\ 
-                     (  \/  )
-                 ____/      \____
-               .'     /\  /\     '.
-              /     _/  \/  \_     \
-             /    _/   /\   \_ \    \
-            |    |__  /  \  __| |    |
-             \     /        \     /
-              '.   '._    _.'   .'
-                 '-.___\__/__.-'
-                    /   /\   \
-                   (   (  )   )
-        """,
-    ]
-    return Spinner(_normalize_frames(raw_frames), delay=0.12)
+    return Spinner(_COCKROACH_FRAMES, delay=0.12)
+
+
+_CHOICES: dict[str, str] = {
+    "chip": "chip",
+    "c": "chip",
+    "cockroach": "cockroach",
+    "roach": "cockroach",
+    "r": "cockroach",
+}
 
 
 def parse_choice(value: str) -> str:
-    lowered = value.strip().lower()
-    if lowered in {"chip", "c"}:
-        return "chip"
-    if lowered in {"cockroach", "roach", "r"}:
-        return "cockroach"
-    raise ValueError(f"Unknown choice: {value!r}")
+    choice = _CHOICES.get(value.strip().lower())
+    if choice is None:
+        raise ValueError(f"Unknown choice: {value!r}")
+    return choice
 
 
 def prompt_choice(input_fn: Callable[[str], str] = input) -> str:
@@ -183,42 +268,202 @@ def prompt_choice(input_fn: Callable[[str], str] = input) -> str:
             print("Please type 'chip' or 'cockroach'.")
 
 
-def animate(spinner: Spinner, *, iterations: int | None = None, writer: object = None, sleep_fn: Callable[[float], None] = None) -> None:
-    writer = writer or sys.stdout
+def _coarse_wait(remaining: float) -> float:
+    """Portion of ``remaining`` to hand to a timer sleep before spinning out the rest."""
+    if not _ON_WINDOWS:
+        return remaining if remaining > 0 else 0.0
+    # Windows timers are coarse: sleep most of the wait, then spin to the deadline.
+    return remaining - SLEEP_SLACK if remaining > SPIN_THRESHOLD else 0.0
+
+
+def _spin_until(deadline: float, clock_fn: Callable[[], float]) -> None:
+    if _ON_WINDOWS:
+        while clock_fn() < deadline:
+            pass
+
+
+def precise_sleep(deadline: float, *, sleep_fn: Callable[[float], None] = None, clock_fn: Callable[[], float] = None) -> None:
+    """Block until ``deadline``, measured on the ``clock_fn`` timeline.
+
+    ``sleep_fn`` must actually advance ``clock_fn``; on Windows the final spin
+    otherwise busy-waits on the real clock.
+    """
+    sleep_fn = sleep_fn or time.sleep
+    clock_fn = clock_fn or time.perf_counter
+    wait = _coarse_wait(deadline - clock_fn())
+    if wait:
+        sleep_fn(wait)
+    _spin_until(deadline, clock_fn)
+
+
+def _stdout_fd(writer: object) -> int | None:
+    if writer is not sys.stdout:
+        return None
+    try:
+        return writer.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    # os.write already retries on EINTR (PEP 475); loop only to finish short writes,
+    # slicing a memoryview so the unwritten tail is never copied.
+    written = os.write(fd, data)
+    if written < len(data):
+        view = memoryview(data)
+        while written < len(view):
+            written += os.write(fd, view[written:])
+
+
+@contextlib.contextmanager
+def _frame_output(spinner: Spinner, writer: object, erase_strategy: str) -> Iterator[Tuple[Callable, Callable | None, Sequence, object]]:
+    """Pick the cheapest way to emit ``spinner``'s frames to ``writer``.
+
+    Yields ``(write_fn, flush_fn, updates, stopped)`` where ``updates`` is the
+    spinner's per-tick output (see ``Spinner._updates``) and ``stopped`` the
+    matching farewell message.
+    """
+    if erase_strategy not in ERASE_STRATEGIES:
+        raise ValueError(f"Unknown erase strategy: {erase_strategy!r}")
     write_fn = writer.write if hasattr(writer, "write") else writer
     flush_fn = writer.flush if hasattr(writer, "flush") else None
-    sleep_fn = sleep_fn or time.sleep
     enable_virtual_terminal_processing()
+    stopped = STOPPED_MESSAGE
+    raw = getattr(writer, "buffer", None)
+    fd = _stdout_fd(writer) if spinner._update_bytes[erase_strategy] is not None else None
+    if fd is not None:
+        # Real stdout: drain Python's buffers once, then hand frames straight to the fd.
+        writer.flush()
+        write_fn = functools.partial(_write_all, fd)
+        flush_fn = None
+        stopped = STOPPED_MESSAGE.encode("ascii")
+        updates = spinner._update_bytes[erase_strategy]
+    elif spinner._update_bytes[erase_strategy] is not None and hasattr(raw, "write"):
+        # ASCII frames can bypass the text layer's encoder and lock entirely.
+        if flush_fn is not None:
+            flush_fn()
+        write_fn = raw.write
+        flush_fn = raw.flush if hasattr(raw, "flush") else None
+        stopped = STOPPED_MESSAGE.encode("ascii")
+        updates = spinner._update_bytes[erase_strategy]
+    else:
+        updates = spinner._updates[erase_strategy]
+    # Multi-line frames would flush at every newline; flush once per frame instead.
+    line_buffered = flush_fn is not None and getattr(writer, "line_buffering", False) and hasattr(writer, "reconfigure")
+    if line_buffered:
+        writer.reconfigure(line_buffering=False)
     try:
-        for index, frame in enumerate(spinner.cycle()):
-            write_fn(f"{CLEAR_AND_HOME}{frame}\n")
-            write_fn("Press Ctrl+C to stop.\n")
-            flush_fn() if flush_fn else None
-            sleep_fn(spinner.delay)
-            if iterations is not None and index + 1 >= iterations:
-                break
-    except KeyboardInterrupt:
-        write_fn(f"{CLEAR_AND_HOME}Stopped. Thanks for spinning!\n")
+        yield write_fn, flush_fn, updates, stopped
+    finally:
+        if line_buffered:
+            writer.reconfigure(line_buffering=True)
+
+
+def animate(
+    spinner: Spinner,
+    *,
+    iterations: int | None = None,
+    writer: object = None,
+    sleep_fn: Callable[[float], None] = None,
+    clock_fn: Callable[[], float] = None,
+    erase_strategy: str = "diff",
+) -> None:
+    """Draw ``spinner`` to ``writer`` (stdout by default) until stopped.
+
+    ``erase_strategy`` picks how each tick replaces the previous frame: ``"diff"``
+    rewrites only changed cells, ``"home"`` overwrites the whole frame in place,
+    and ``"clear"`` erases the screen first. The first tick always clears.
+
+    ``sleep_fn`` and ``clock_fn`` are injectable together: frames are paced on
+    ``clock_fn`` deadlines, so a ``sleep_fn`` that does not advance ``clock_fn``
+    sees growing waits and, on Windows, a real-time spin each tick.
+    """
+    sleep_fn = sleep_fn or time.sleep
+    clock_fn = clock_fn or time.perf_counter
+    with _frame_output(spinner, writer or sys.stdout, erase_strategy) as (write_fn, flush_fn, updates, stopped):
+        ticks = range(iterations) if iterations is not None else itertools.count()
+        wrap = len(updates) - 1
+        index = 0
+        delay = spinner.delay
+        # Bind globals and builtins used per frame to locals.
+        pace = precise_sleep
+        latest = max
+        # Pace against absolute deadlines so time spent writing is not added to the delay.
+        next_deadline = clock_fn() + delay
+        try:
+            # Separate loops keep the flush decision out of the per-frame path.
+            if flush_fn is None:
+                for _ in ticks:
+                    write_fn(updates[index])
+                    index = index % wrap + 1
+                    pace(next_deadline, sleep_fn=sleep_fn, clock_fn=clock_fn)
+                    next_deadline = latest(next_deadline + delay, clock_fn())
+            else:
+                for _ in ticks:
+                    write_fn(updates[index])
+                    flush_fn()
+                    index = index % wrap + 1
+                    pace(next_deadline, sleep_fn=sleep_fn, clock_fn=clock_fn)
+                    next_deadline = latest(next_deadline + delay, clock_fn())
+        except KeyboardInterrupt:
+            write_fn(stopped)
+
+
+async def animate_async(
+    spinner: Spinner,
+    *,
+    iterations: int | None = None,
+    writer: object = None,
+    clock_fn: Callable[[], float] = None,
+    erase_strategy: str = "diff",
+) -> None:
+    """Like :func:`animate`, but awaits ``asyncio.sleep`` between frames.
+
+    Pacing matches :func:`precise_sleep`, including the short spin on Windows.
+    """
+    clock_fn = clock_fn or time.perf_counter
+    with _frame_output(spinner, writer or sys.stdout, erase_strategy) as (write_fn, flush_fn, updates, stopped):
+        ticks = range(iterations) if iterations is not None else itertools.count()
+        wrap = len(updates) - 1
+        index = 0
+        delay = spinner.delay
+        # Bind globals and builtins used per frame to locals.
+        sleep = asyncio.sleep
+        coarse_wait = _coarse_wait
+        spin_until = _spin_until
+        latest = max
+        next_deadline = clock_fn() + delay
+        try:
+            for _ in ticks:
+                write_fn(updates[index])
+                if flush_fn is not None:
+                    flush_fn()
+                index = index % wrap + 1
+                await sleep(coarse_wait(next_deadline - clock_fn()))
+                spin_until(next_deadline, clock_fn)
+                next_deadline = latest(next_deadline + delay, clock_fn())
+        except asyncio.CancelledError:
+            # Ctrl+C under asyncio.run() arrives as a cancellation of the main task.
+            write_fn(stopped)
+            raise
 
 
 def enable_virtual_terminal_processing() -> None:
     """Ensure ANSI escape sequences are honored on Windows consoles."""
-    if os.name != "nt":
-        return
-    # Cache result to avoid repeated system calls.
-    if getattr(enable_virtual_terminal_processing, "_enabled", False):
+    global _VT_ENABLED
+    if _VT_ENABLED is not None or not _ON_WINDOWS:
         return
+    _VT_ENABLED = False
     try:
-        kernel32 = ctypes.windll.kernel32
-        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        handle = _GetStdHandle(STD_OUTPUT_HANDLE)
         mode = wintypes.DWORD()
-        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
-            new_mode = mode.value | ENABLE_VT_FLAG
-            if kernel32.SetConsoleMode(handle, new_mode):
-                enable_virtual_terminal_processing._enabled = True
+        if _GetConsoleMode(handle, ctypes.byref(mode)):
+            if _SetConsoleMode(handle, mode.value | ENABLE_VT_FLAG):
+                _VT_ENABLED = True
     except Exception:
-        # Silently ignore if enabling VT processing fails.
-        enable_virtual_terminal_processing._enabled = False
+        # Silently ignore if enabling VT processing fails; a redirected
+        # stdout will not start succeeding on a later call.
+        pass
 
 
 class PhraseGenerator:
@@ -231,20 +476,20 @@ class PhraseGenerator:
         if not self.intros or not self.claims:
             raise ValueError("PhraseGenerator needs intros and claims.")
         self.counter = 0
+        # Intros vary fastest, then claims; only the counter is formatted per call.
+        self._prefixes = tuple(f"{intro} {claim} ({self.tag} #" for claim in self.claims for intro in self.intros)
+        self._cycle = itertools.cycle(self._prefixes)
 
     def __iter__(self):
         return self
 
     def __next__(self) -> str:
-        idx = self.counter
-        intro = self.intros[idx % len(self.intros)]
-        claim = self.claims[(idx // len(self.intros)) % len(self.claims)]
         self.counter += 1
         # Include a rolling marker to guarantee uniqueness over time.
-        return f"{intro} {claim} ({self.tag} #{self.counter})"
+        return f"{next(self._cycle)}{self.counter})"
 
 
-def run_debate() -> None:
+async def run_debate() -> None:
     """Alternate chip and cockroach spins with playful banter."""
     chip = chip_spinner()
     roach = cockroach_spinner()
@@ -284,17 +529,22 @@ def run_debate() -> None:
     )
 
     print("Starting with the chip. Ctrl+C to exit.")
+    chip_line = next(pro_claude)
     while True:
-        animate(chip, iterations=len(chip.frames))
-        print(f"Chip: {next(pro_claude)}")
-        time.sleep(3)
-        animate(roach, iterations=len(roach.frames))
-        print(f"Cockroach: {next(pro_chatgpt)}")
-        time.sleep(3)
+        await animate_async(chip, iterations=len(chip.frames))
+        print(f"Chip: {chip_line}")
+        # Prepare the rebuttal while the pause elapses.
+        roach_line, _ = await asyncio.gather(asyncio.to_thread(next, pro_chatgpt), asyncio.sleep(3))
+        await animate_async(roach, iterations=len(roach.frames))
+        print(f"Cockroach: {roach_line}")
+        chip_line, _ = await asyncio.gather(asyncio.to_thread(next, pro_claude), asyncio.sleep(3))
 
 
 def main() -> None:
-    run_debate()
+    try:
+        asyncio.run(run_debate())
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == "__main__":
@@ -1,4 +1,9 @@
+import asyncio
+import io
+import os
+import re
 import unittest
+from unittest import mock
 
 import spinner
 
@@ -10,6 +15,33 @@ def frame_dimensions(frame: str) -> tuple[int, int]:
     return height, width
 
 
+ANSI_OR_TEXT = re.compile(r"\x1b\[(\d*)(?:;(\d+))?([HJ])|\n|[^\x1b\n]+")
+
+
+def render_screen(output: str) -> list[str]:
+    """Replay cursor moves, clears and text onto a grid of rows."""
+    rows: list[list[str]] = []
+    row = col = 0
+    for match in ANSI_OR_TEXT.finditer(output):
+        text = match.group(0)
+        if match.group(3) == "J":
+            rows = []
+        elif match.group(3) == "H":
+            row = int(match.group(1) or 1) - 1
+            col = int(match.group(2) or 1) - 1
+        elif text == "\n":
+            row += 1
+            col = 0
+        else:
+            while len(rows) <= row:
+                rows.append([])
+            line = rows[row]
+            line.extend(" " * (col + len(text) - len(line)))
+            line[col:col + len(text)] = text
+            col += len(text)
+    return ["".join(line).rstrip() for line in rows]
+
+
 class TestFrames(unittest.TestCase):
     def test_chip_frames_same_size(self):
         frames = spinner.chip_spinner().frames
@@ -50,15 +82,259 @@ class FakeWriter:
         return "".join(self.buffer)
 
 
+class FakeTextStream(FakeWriter):
+    """Text writer that, like sys.stdout, exposes a binary ``buffer``."""
+
+    def __init__(self):
+        super().__init__()
+        self.text = []
+        self.buffer = io.BytesIO()
+
+    def write(self, text: str):
+        self.text.append(text)
+
+
+class FakeLineBufferedStream(FakeWriter):
+    """Text writer that records reconfigure() calls and flushes."""
+
+    def __init__(self):
+        super().__init__()
+        self.line_buffering = True
+        self.events = []
+
+    def write(self, text: str):
+        self.events.append(("write", self.line_buffering))
+
+    def flush(self):
+        self.events.append(("flush", self.line_buffering))
+
+    def reconfigure(self, *, line_buffering: bool):
+        self.line_buffering = line_buffering
+
+
+class FakeClock:
+    """Clock that only moves when slept on, plus a tiny tick per read."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        self.now += 1e-5
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def instant_clock() -> dict:
+    """animate() kwargs whose sleeps advance a fake clock instead of real time."""
+    clock = FakeClock()
+    return {"sleep_fn": clock.sleep, "clock_fn": clock}
+
+
 class TestAnimate(unittest.TestCase):
     def test_animate_runs_requested_iterations(self):
         sp = spinner.chip_spinner()
         writer = FakeWriter()
-        spinner.animate(sp, iterations=3, writer=writer, sleep_fn=lambda _: None)
+        spinner.animate(sp, iterations=3, writer=writer, **instant_clock())
         output = writer.joined()
-        self.assertEqual(output.count(spinner.CLEAR_AND_HOME), 3)
+        self.assertEqual(output.count(spinner.CLEAR_AND_HOME), 1)
+        self.assertIn("Press Ctrl+C to stop.", output)
+
+    def test_animate_writes_once_per_frame(self):
+        sp = spinner.chip_spinner()
+        writer = FakeWriter()
+        spinner.animate(sp, iterations=5, writer=writer, **instant_clock())
+        self.assertEqual(len(writer.buffer), 5)
+
+    def test_every_erase_strategy_reproduces_frames(self):
+        for strategy in spinner.ERASE_STRATEGIES:
+            for sp in (spinner.chip_spinner(), spinner.cockroach_spinner()):
+                writer = FakeWriter()
+                spinner.animate(sp, iterations=9, writer=writer, erase_strategy=strategy, **instant_clock())
+                for tick in range(9):
+                    screen = render_screen("".join(writer.buffer[: tick + 1]))
+                    expected = [line.rstrip() for line in sp.frames[tick % len(sp.frames)].splitlines()]
+                    self.assertEqual(expected + ["Press Ctrl+C to stop."], screen, strategy)
+
+    def test_home_strategy_clears_only_first_frame(self):
+        sp = spinner.cockroach_spinner()
+        writer = FakeWriter()
+        spinner.animate(sp, iterations=4, writer=writer, erase_strategy="home", **instant_clock())
+        self.assertEqual(1, writer.joined().count(spinner.CLEAR_SCREEN))
+        self.assertTrue(all(chunk.startswith(spinner.MOVE_HOME) for chunk in writer.buffer[1:]))
+
+    def test_unknown_erase_strategy(self):
+        with self.assertRaises(ValueError):
+            spinner.animate(spinner.chip_spinner(), iterations=1, writer=FakeWriter(), erase_strategy="wipe")
+
+    def test_animate_writes_bytes_to_binary_buffer(self):
+        sp = spinner.chip_spinner()
+        stream = FakeTextStream()
+        spinner.animate(sp, iterations=3, writer=stream, **instant_clock())
+        self.assertEqual([], stream.text)
+        output = stream.buffer.getvalue().decode("ascii")
+        self.assertTrue(output.startswith(spinner.CLEAR_AND_HOME))
         self.assertIn("Press Ctrl+C to stop.", output)
 
+    def test_animate_issues_one_buffer_write_per_tick(self):
+        sp = spinner.cockroach_spinner()
+        stream = FakeTextStream()
+        writes = []
+        stream.buffer.write = writes.append
+        spinner.animate(sp, iterations=6, writer=stream, **instant_clock())
+        self.assertEqual(6, len(writes))
+        self.assertTrue(all(isinstance(chunk, bytes) for chunk in writes))
+
+    def test_animate_writes_real_stdout_through_fd(self):
+        read_fd, write_fd = os.pipe()
+        with open(read_fd, "rb") as reader, open(write_fd, "w") as stream:
+            stream.write("pending text\n")
+            with mock.patch("sys.stdout", stream), mock.patch("os.write", wraps=os.write) as fd_write:
+                spinner.animate(spinner.chip_spinner(), iterations=2, **instant_clock())
+            stream.close()
+            output = reader.read().decode("ascii")
+        self.assertEqual(2, fd_write.call_count)
+        self.assertTrue(output.startswith("pending text\n" + spinner.CLEAR_AND_HOME))
+        self.assertIn("Press Ctrl+C to stop.", output)
+
+    def test_write_all_finishes_short_writes(self):
+        chunks = []
+
+        def short_write(fd: int, data) -> int:
+            chunks.append(bytes(data[:7]))
+            return len(chunks[-1])
+
+        with mock.patch("os.write", short_write):
+            spinner._write_all(1, b"0123456789abcdefghij")
+        self.assertEqual([b"0123456", b"789abcd", b"efghij"], chunks)
+
+    def test_animate_non_ascii_frames_use_text_path(self):
+        sp = spinner.Spinner(["\u00b7", "o"])
+        stream = FakeTextStream()
+        spinner.animate(sp, iterations=2, writer=stream, **instant_clock())
+        self.assertEqual(b"", stream.buffer.getvalue())
+        self.assertEqual(2, len(stream.text))
+
+    def test_animate_disables_line_buffering_for_text_frames(self):
+        sp = spinner.Spinner(["\u00b7\n.", "o\n."])
+        stream = FakeLineBufferedStream()
+        spinner.animate(sp, iterations=2, writer=stream, **instant_clock())
+        self.assertEqual([("write", False), ("flush", False)] * 2, stream.events)
+        self.assertTrue(stream.line_buffering)
+
+    def test_deltas_pad_uneven_frames(self):
+        sp = spinner.Spinner(["ab\ncd", "x"])
+        for strategy in ("diff", "home"):
+            writer = FakeWriter()
+            spinner.animate(sp, iterations=2, writer=writer, erase_strategy=strategy, **instant_clock())
+            self.assertEqual(["x", "", "Press Ctrl+C to stop."], render_screen(writer.joined()))
+        sp = spinner.Spinner(["x", "ab\ncd"])
+        for strategy in ("diff", "home"):
+            for tick, expected in enumerate((["x", ""], ["ab", "cd"], ["x", ""])):
+                writer = FakeWriter()
+                spinner.animate(sp, iterations=tick + 1, writer=writer, erase_strategy=strategy, **instant_clock())
+                self.assertEqual(expected + ["Press Ctrl+C to stop."], render_screen(writer.joined()), strategy)
+
+    def test_animate_accepts_bare_callable(self):
+        sp = spinner.chip_spinner()
+        chunks = []
+        spinner.animate(sp, iterations=2, writer=chunks.append, **instant_clock())
+        self.assertEqual(len(chunks), 2)
+
+    def test_animate_subtracts_write_time_from_delay(self):
+        sp = spinner.chip_spinner()
+        clock = FakeClock()
+
+        def slow_write(text: str):
+            clock.now += 0.02
+
+        spinner.animate(sp, iterations=3, writer=slow_write, sleep_fn=clock.sleep, clock_fn=clock)
+        self.assertEqual(len(clock.sleeps), 3)
+        for seconds in clock.sleeps:
+            self.assertAlmostEqual(sp.delay - 0.02, seconds, delta=2e-3)
+
+
+class TestAnimateAsync(unittest.TestCase):
+    def test_animate_async_paces_like_precise_sleep(self):
+        sp = spinner.chip_spinner()
+        clock = FakeClock()
+        waits = []
+
+        async def fake_sleep(seconds: float):
+            waits.append(seconds)
+            clock.now += seconds
+
+        with mock.patch("asyncio.sleep", fake_sleep):
+            asyncio.run(spinner.animate_async(sp, iterations=3, writer=FakeWriter(), clock_fn=clock))
+        self.assertEqual(3, len(waits))
+        for seconds in waits:
+            self.assertAlmostEqual(sp.delay, seconds, delta=2e-3)
+
+    def test_animate_async_runs_requested_iterations(self):
+        sp = spinner.Spinner(spinner.chip_spinner().frames, delay=0)
+        writer = FakeWriter()
+        asyncio.run(spinner.animate_async(sp, iterations=3, writer=writer))
+        self.assertEqual(3, len(writer.buffer))
+        self.assertEqual(1, writer.joined().count(spinner.CLEAR_AND_HOME))
+
+    def test_animate_async_writes_stop_message_on_cancel(self):
+        sp = spinner.chip_spinner()
+        writer = FakeWriter()
+
+        async def cancel_after_first_frame():
+            task = asyncio.create_task(spinner.animate_async(sp, writer=writer))
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_after_first_frame())
+        self.assertEqual(spinner.STOPPED_MESSAGE, writer.buffer[-1])
+
+    def test_animate_is_reentrant_for_one_spinner(self):
+        sp = spinner.Spinner(spinner.chip_spinner().frames, delay=0)
+        writers = [FakeWriter(), FakeWriter()]
+
+        async def spin_twice():
+            await asyncio.gather(*(spinner.animate_async(sp, iterations=5, writer=writer) for writer in writers))
+
+        asyncio.run(spin_twice())
+        self.assertEqual(writers[0].buffer, writers[1].buffer)
+
+
+class TestVirtualTerminal(unittest.TestCase):
+    def enable_with(self, get_console_mode):
+        set_console_mode = mock.Mock(return_value=1)
+        with mock.patch.multiple(
+            spinner,
+            _ON_WINDOWS=True,
+            _VT_ENABLED=None,
+            _GetStdHandle=mock.Mock(return_value=7),
+            _GetConsoleMode=get_console_mode,
+            _SetConsoleMode=set_console_mode,
+            create=True,
+        ):
+            spinner.enable_virtual_terminal_processing()
+            spinner.enable_virtual_terminal_processing()
+            return spinner._VT_ENABLED, set_console_mode
+
+    def test_failed_console_mode_is_tried_once(self):
+        get_console_mode = mock.Mock(return_value=0)
+        enabled, set_console_mode = self.enable_with(get_console_mode)
+        self.assertIs(False, enabled)
+        self.assertEqual(1, get_console_mode.call_count)
+        set_console_mode.assert_not_called()
+
+    def test_success_enables_vt_processing(self):
+        get_console_mode = mock.Mock(return_value=1)
+        enabled, set_console_mode = self.enable_with(get_console_mode)
+        self.assertIs(True, enabled)
+        self.assertEqual(1, get_console_mode.call_count)
+        set_console_mode.assert_called_once_with(7, spinner.ENABLE_VT_FLAG)
+
 
 class TestPhraseGenerator(unittest.TestCase):
     def test_unique_phrases(self):
@@ -68,6 +344,13 @@ class TestPhraseGenerator(unittest.TestCase):
         for text in phrases:
             self.assertIn("tag #", text)
 
+    def test_phrase_order_walks_intros_then_claims(self):
+        pg = spinner.PhraseGenerator(["a", "b"], ["c", "d"], "tag")
+        self.assertEqual(
+            ["a c (tag #1)", "b c (tag #2)", "a d (tag #3)", "b d (tag #4)", "a c (tag #5)"],
+            [next(pg) for _ in range(5)],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()